@@ -2,11 +2,10 @@ from __future__ import annotations
 
 import calendar
 import time
-from datetime import datetime
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import pytz
 import requests
 from discord_webhook import DiscordEmbed
 from loguru import logger
@@ -273,7 +272,7 @@ def create_embed(previous_games: Path, game: dict) -> DiscordEmbed | None:
 
     embed.set_author(name=game_name, url=url, icon_url=settings.epic_icon)
 
-    curr_dt: datetime = datetime.now(tz=pytz.UTC)
+    curr_dt: datetime = datetime.now(tz=UTC)
     current_time = int(round(curr_dt.timestamp()))
     end_time: int = promotion_end(game)
     start_time: int = promotion_start(game)
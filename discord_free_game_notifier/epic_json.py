@@ -22,10 +22,13 @@ if TYPE_CHECKING:
     from collections.abc import Generator
 
 
-def create_json_file() -> None:
+def create_json_file(output_path: Path | None = None) -> None:
     """Create or overwrite the Epic.json file with the free games.
 
     The bot will use this file to check if there are any new free games.
+
+    Args:
+        output_path: Where to write the file. Defaults to pages/epic.json.
     """
     free_games: dict[str, list[dict[str, str]]] = {
         "free_games": [
@@ -142,7 +145,10 @@ def create_json_file() -> None:
         ],
     }
 
-    with Path.open(Path("pages/epic.json"), "w", encoding="utf-8") as file:
+    if output_path is None:
+        output_path = Path("pages/epic.json")
+
+    with Path.open(output_path, "w", encoding="utf-8") as file:
         json.dump(free_games, file, indent=4)
         logger.bind(game_name="Epic").info("Created/updated epic.json")
 
@@ -184,6 +190,7 @@ def scrape_epic_json() -> Generator[DiscordEmbed | None, Any, list[Any] | None]:
 
     # Get the free games from Epic.json
     free_games = epic_json["free_games"]
+    current_time = int(datetime.datetime.now(tz=datetime.UTC).timestamp())
 
     for _game in free_games:
         game_id: str = _game["id"]
@@ -204,7 +211,6 @@ def scrape_epic_json() -> Generator[DiscordEmbed | None, Any, list[Any] | None]:
             continue
 
         # Check if the game is still free
-        current_time = int(datetime.datetime.now(tz=datetime.UTC).timestamp())
         if unix_end_date < current_time:
             logger.info(f"{game_name} is no longer free")
             continue
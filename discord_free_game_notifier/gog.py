@@ -165,7 +165,7 @@ def get_giveaway_link(giveaway: Tag | NavigableString | None, game_name: str) ->
     return giveaway_link
 
 
-def get_game_image(giveaway: BeautifulSoup, game_name: str) -> str:
+def get_game_image(giveaway: Tag, game_name: str) -> str:
     """Get the game image from the GOG giveaway.
 
     Args:
@@ -208,17 +208,16 @@ def get_game_image(giveaway: BeautifulSoup, game_name: str) -> str:
     return image_url
 
 
-def get_game_name(giveaway_soup: BeautifulSoup, giveaway: Tag | NavigableString | None) -> str:
+def get_game_name(giveaway: Tag) -> str:
     """Get the game name from the GOG giveaway.
 
     Args:
-        giveaway_soup: The giveaway tag.
         giveaway: The giveaway tag.
 
     Returns:
         The game name. Defaults to "GOG Giveaway" if not found.
     """
-    img_tag: Tag | NavigableString | None = giveaway_soup.find("img", alt=True)
+    img_tag: Tag | NavigableString | None = giveaway.find("img", alt=True)
     if not hasattr(img_tag, "attrs"):
         logger.bind(game_name="GOG").error("No img tag found on GOG for {}", giveaway)
         return "GOG Giveaway"
@@ -262,19 +261,18 @@ def get_free_gog_game() -> DiscordEmbed | None:
 
     soup = BeautifulSoup(request.text, "html.parser")
     giveaway: Tag | NavigableString | None = soup.find("giveaway")
-    giveaway_soup: BeautifulSoup = BeautifulSoup(str(giveaway), "html.parser")
 
-    if giveaway is None:
+    if not isinstance(giveaway, Tag):
         return None
 
     # Get the game name
-    game_name: str = get_game_name(giveaway_soup=giveaway_soup, giveaway=giveaway)
+    game_name: str = get_game_name(giveaway=giveaway)
 
     if already_posted(previous_games=previous_games, game_name=game_name):
         return None
 
     giveaway_link: str = get_giveaway_link(giveaway=giveaway, game_name=game_name)
-    image_url: str = get_game_image(giveaway=giveaway_soup, game_name=game_name)
+    image_url: str = get_game_image(giveaway=giveaway, game_name=game_name)
 
     # Create the embed and add it to the list of free games.
     return create_embed(
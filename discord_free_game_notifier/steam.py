@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import requests
-from bs4 import BeautifulSoup, ResultSet, Tag
+from bs4 import BeautifulSoup, ResultSet, SoupStrainer, Tag
 from discord_webhook import DiscordEmbed
 from loguru import logger
 
@@ -34,7 +34,10 @@ def get_free_steam_games() -> Generator[DiscordEmbed, Any, None]:
         },
         timeout=30,
     )
-    soup = BeautifulSoup(request.text, "html.parser")
+    # Only build the tree for the search result rows, the rest of the page is never looked at.
+    # The strainer sees the raw class attribute ("search_result_row ds_collapse_flag "), so check each class.
+    search_result_rows = SoupStrainer("a", class_=lambda c: c is not None and "search_result_row" in c.split())
+    soup = BeautifulSoup(request.text, "html.parser", parse_only=search_result_rows)
     games: ResultSet[Any] = soup.find_all("a", class_="search_result_row")
     for game in games:
         embed = DiscordEmbed()
@@ -159,6 +159,7 @@ def scrape_steam_json() -> Generator[DiscordEmbed | None, Any, list[Any] | None]
 
     # Get the free games from steam.json
     free_games = steam_json["free_games"]
+    now: datetime.datetime = datetime.datetime.now(tz=datetime.UTC)
 
     for _game in free_games:
         game_id: str = _game["id"]
@@ -169,11 +170,11 @@ def scrape_steam_json() -> Generator[DiscordEmbed | None, Any, list[Any] | None]
         developer: str = _game["developer"]
 
         # When the giveaway starts
-        start_date: str = _game["start_date"] or datetime.datetime.now(tz=datetime.UTC).isoformat()
+        start_date: str = _game["start_date"] or now.isoformat()
         start_date_unix: int = int(datetime.datetime.fromisoformat(start_date).timestamp())
 
         # When the giveaway ends
-        end_date: str = _game["end_date"] or datetime.datetime.now(tz=datetime.UTC).isoformat()
+        end_date: str = _game["end_date"] or now.isoformat()
         end_date_unix: int = int(datetime.datetime.fromisoformat(end_date).timestamp())
 
         # Check if the game has already been posted
@@ -181,9 +182,7 @@ def scrape_steam_json() -> Generator[DiscordEmbed | None, Any, list[Any] | None]
             continue
 
         # Check if the game is still free
-
-        current_time = int(datetime.datetime.now(tz=datetime.UTC).timestamp())
-        if end_date_unix < current_time:
+        if end_date_unix < int(now.timestamp()):
             logger.info(f"{game_name} is no longer free")
             continue
 
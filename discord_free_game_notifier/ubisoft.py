@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime
 import json
+from http import HTTPStatus
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -17,10 +18,13 @@ if TYPE_CHECKING:
     from collections.abc import Generator
 
 
-def create_json_file() -> None:
+def create_json_file(output_path: Path | None = None) -> None:
     """Create or overwrite the ubisoft.json file with the free games.
 
     The bot will use this file to check if there are any new free games.
+
+    Args:
+        output_path: Where to write the file. Defaults to pages/ubisoft.json.
     """
     free_games: dict[str, list[dict[str, str]]] = {
         "free_games": [
@@ -36,26 +40,111 @@ def create_json_file() -> None:
         ],
     }
 
-    with Path.open(Path("pages/ubisoft.json"), "w", encoding="utf-8") as file:
+    if output_path is None:
+        output_path = Path("pages/ubisoft.json")
+
+    with Path.open(output_path, "w", encoding="utf-8") as file:
         json.dump(free_games, file, indent=4)
         logger.bind(game_name="Ubisoft").info("Created/updated ubisoft.json")
 
 
+def remove_cached_json(cached_json: Path, cached_etag: Path) -> None:
+    """Remove the cached ubisoft.json and its ETag.
+
+    Args:
+        cached_json: The cached ubisoft.json.
+        cached_etag: The ETag file that belongs to the cached ubisoft.json.
+    """
+    try:
+        cached_json.unlink(missing_ok=True)
+        cached_etag.unlink(missing_ok=True)
+    except OSError as e:
+        logger.bind(game_name="Ubisoft").warning(f"Unable to remove cached ubisoft.json: {e}")
+
+
+def read_cached_json(cached_json: Path, cached_etag: Path) -> dict | None:
+    """Read the cached ubisoft.json that get_json() saved.
+
+    A cache that can't be read or parsed is deleted so the next request isn't conditional.
+
+    Args:
+        cached_json: The cached ubisoft.json.
+        cached_etag: The ETag file that belongs to the cached ubisoft.json.
+
+    Returns:
+        The cached json as a dict, or None if the cache was unusable.
+    """
+    try:
+        return json.loads(cached_json.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        logger.bind(game_name="Ubisoft").warning(f"Cached ubisoft.json is unusable, removing it: {e}")
+        remove_cached_json(cached_json=cached_json, cached_etag=cached_etag)
+        return None
+
+
+def fetch_json(json_location: str, headers: dict[str, str]) -> requests.Response | None:
+    """Request ubisoft.json.
+
+    Args:
+        json_location: The URL of ubisoft.json.
+        headers: Extra request headers, e.g. If-None-Match.
+
+    Returns:
+        The response, or None if we couldn't connect.
+    """
+    try:
+        return requests.get(json_location, headers=headers, timeout=30)
+    except requests.exceptions.ConnectionError:
+        logger.bind(game_name="Ubisoft").error(f"Unable to connect to {json_location}")
+        return None
+
+
 def get_json() -> dict:
     """Gets a json file from the json folder.
 
+    The last response is cached in the app directory together with its ETag,
+    so polls where ubisoft.json hasn't changed only get a 304 back.
+
     Returns:
         dict: The json file as a dict.
     """
     json_location: str = "https://thelovinator1.github.io/discord-free-game-notifier/ubisoft.json"
+    cached_json: Path = Path(settings.app_dir) / "ubisoft.json"
+    cached_etag: Path = Path(settings.app_dir) / "ubisoft.etag"
     json_file: dict = {}
 
-    try:
-        json_file = requests.get(json_location, timeout=30).json()
-    except requests.exceptions.ConnectionError:
+    headers: dict[str, str] = {}
+    if cached_json.is_file() and cached_etag.is_file():
+        headers["If-None-Match"] = cached_etag.read_text(encoding="utf-8")
+
+    response: requests.Response | None = fetch_json(json_location=json_location, headers=headers)
+    if response is not None and response.status_code == HTTPStatus.NOT_MODIFIED and "If-None-Match" in headers:
+        cached: dict | None = read_cached_json(cached_json=cached_json, cached_etag=cached_etag)
+        if cached is not None:
+            logger.bind(game_name="Ubisoft").debug("ubisoft.json has not changed, using cached copy")
+            return cached
+
+        # read_cached_json() removed the broken cache, so ask once more for the whole file.
+        response = fetch_json(json_location=json_location, headers={})
+
+    if response is None:
+        return json_file
+
+    if response.status_code != HTTPStatus.OK:
         logger.bind(game_name="Ubisoft").error(
-            "Unable to connect to https://thelovinator1.github.io/discord-free-game-notifier/ubisoft.json",
+            f"Unexpected response for {json_location}: {response.status_code} - {response.reason}",
         )
+        return json_file
+
+    json_file = response.json()
+    if etag := response.headers.get("ETag"):
+        try:
+            cached_json.write_text(response.text, encoding="utf-8")
+            # Only save the ETag once the body it belongs to is on disk.
+            cached_etag.write_text(etag, encoding="utf-8")
+        except OSError as e:
+            logger.bind(game_name="Ubisoft").warning(f"Unable to cache ubisoft.json: {e}")
+            remove_cached_json(cached_json=cached_json, cached_etag=cached_etag)
     return json_file
 
 
@@ -82,9 +171,15 @@ def get_ubisoft_free_games() -> Generator[DiscordEmbed | None, Any, None]:
 
     # Get the free games from ubisoft.json
     free_games = ubisoft_json["free_games"]
+    current_time = int(datetime.datetime.now(tz=datetime.UTC).timestamp())
 
     for game in free_games:
         game_id: str = game["id"]
+
+        # Check if the game has already been posted
+        if already_posted(previous_games, game_id):
+            continue
+
         game_name: str = game["game_name"]
         description: str = game["description"]
         game_url: str = game["game_url"]
@@ -94,12 +189,7 @@ def get_ubisoft_free_games() -> Generator[DiscordEmbed | None, Any, None]:
         end_date: str = game["end_date"]
         unix_end_date: int = int(datetime.datetime.fromisoformat(end_date).timestamp())
 
-        # Check if the game has already been posted
-        if already_posted(previous_games, game_id):
-            continue
-
         # Check if the game is still free
-        current_time = int(datetime.datetime.now(tz=datetime.UTC).timestamp())
         if unix_end_date < current_time:
             logger.info(f"{game_name} is no longer free")
             continue
@@ -14,12 +14,24 @@ def already_posted(previous_games: Path, game_name: str) -> bool:
 
     Returns:
         bool: True if already has been posted.
+
+    Raises:
+        PermissionError: If previous_games is a file we aren't allowed to read.
     """
-    if Path.is_file(Path(previous_games)):
+    try:
         with Path.open(Path(previous_games), "r", encoding="utf-8") as file:
-            if game_name in file.read():
-                logger.bind(game_name=game_name).debug(
-                    "has already been posted before. Skipping!",
-                )
-                return True
+            posted_games: str = file.read()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return False
+    except PermissionError:
+        # Windows raises PermissionError instead of IsADirectoryError when opening a directory.
+        if Path(previous_games).is_dir():
+            return False
+        raise
+
+    if game_name in posted_games:
+        logger.bind(game_name=game_name).debug(
+            "has already been posted before. Skipping!",
+        )
+        return True
     return False
@@ -15,9 +15,9 @@ def send_webhook(message: str, game_service: str = "") -> Response:
     Returns:
         Response: The response from the webhook request.
     """
-    if get_webhook_url(game_service):
+    if service_webhook_url := get_webhook_url(game_service):
         webhook = DiscordWebhook(
-            url=get_webhook_url(game_service),
+            url=service_webhook_url,
             content=message,
             rate_limit_retry=True,
         )
@@ -67,9 +67,9 @@ def send_embed_webhook(embed: DiscordEmbed, game_service: str = "") -> Response:
     Returns:
         Response: The response from the
     """
-    if get_webhook_url(game_service):
+    if service_webhook_url := get_webhook_url(game_service):
         webhook = DiscordWebhook(
-            url=get_webhook_url(game_service),
+            url=service_webhook_url,
             rate_limit_retry=True,
         )
         webhook.add_embed(embed)
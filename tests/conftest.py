@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the --network option so tests that talk to the real sites are opt-in."""
+    parser.addoption(
+        "--network",
+        action="store_true",
+        default=False,
+        help="Run tests that make requests to GOG, Epic, Steam, Discord, etc.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the network marker."""
+    config.addinivalue_line("markers", "network: test makes real HTTP requests, only runs with --network")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip tests marked with network unless --network was given."""
+    if config.getoption("--network"):
+        return
+
+    skip_network = pytest.mark.skip(reason="needs --network to run")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-import calendar
+import datetime
+import json
 import time
 from pathlib import Path
 
+import pytest
+
 from discord_free_game_notifier.epic import (
     check_promotion,
     game_image,
     game_url,
+    if_mystery_game,
     promotion_end,
     promotion_start,
 )
-from discord_free_game_notifier.epic_json import get_json
+from discord_free_game_notifier.epic_json import create_json_file, get_json
 from discord_free_game_notifier.utils import already_posted
 
 game = {
@@ -124,31 +128,22 @@ game = {
 }
 
 
+# startDate/endDate of the promotional offer in game above.
+EXPECTED_PROMOTION_START: int = int(datetime.datetime(2022, 9, 22, 15, 0, 0, tzinfo=datetime.UTC).timestamp())
+# promotion_end() parses the date with time.mktime(), so it is read as local time.
+EXPECTED_PROMOTION_END: int = int(time.mktime(datetime.datetime(2022, 9, 29, 15, 0, 0).timetuple()))  # noqa: DTZ001
+
+
 def test_promotion_start() -> None:
     """Test that the promotion start date is returned correctly."""
-    start_date: int | None = None
-    if game["promotions"]:
-        for promotion in game["promotions"]["promotionalOffers"]:
-            for offer in promotion["promotionalOffers"]:
-                start_date = calendar.timegm(
-                    time.strptime(offer["startDate"], "%Y-%m-%dT%H:%M:%S.%fZ"),
-                )
-
     result: int = promotion_start(game)
-    assert result == start_date
+    assert result == EXPECTED_PROMOTION_START
 
 
 def test_promotion_end() -> None:
     """Test that the promotion end date is returned correctly."""
-    end_date: float | None = None
-    for promotion in game["promotions"]["promotionalOffers"]:
-        for offer in promotion["promotionalOffers"]:
-            end_date = time.mktime(
-                time.strptime(offer["endDate"], "%Y-%m-%dT%H:%M:%S.%fZ"),
-            )
-
     result: int = promotion_end(game)
-    assert result == end_date
+    assert result == EXPECTED_PROMOTION_END
 
 
 def test_game_image() -> None:
@@ -168,6 +163,20 @@ def test_check_promotion() -> None:
     assert check_promotion(game)
 
 
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("Mystery Game", True),
+        ("Gloomhaven", False),
+        ("Mystery Island", False),
+        ("", False),
+    ],
+)
+def test_if_mystery_game(title: str, *, expected: bool) -> None:
+    """Test that only the "Mystery Game" placeholder is treated as a mystery game."""
+    assert if_mystery_game({"title": title}) is expected
+
+
 def test_already_posted() -> None:
     """Test that the function returns True when a game has already been posted."""
     file_path = Path("tests/games.txt")
@@ -180,7 +189,12 @@ def test_already_posted() -> None:
     result3: bool = already_posted("Not_a_file", "Sharks")  # type: ignore  # noqa: PGH003
     assert not result3
 
+    # A path "below" a file raises NotADirectoryError instead of FileNotFoundError.
+    result4: bool = already_posted(file_path / "Half Life 3", "Half Life 3")
+    assert not result4
+
 
+@pytest.mark.network
 def test_get_json() -> None:
     """Test that the get_json function returns a dict."""
     json = get_json()
@@ -194,3 +208,13 @@ def test_get_json() -> None:
     assert json["free_games"][0]["end_date"]
     assert json["free_games"][0]["description"]
     assert json["free_games"][0]["image_link"]
+
+
+def test_create_json_file(tmp_path: Path) -> None:
+    """Test that create_json_file writes the free games to the given path."""
+    output_path: Path = tmp_path / "epic.json"
+    create_json_file(output_path=output_path)
+
+    free_games: dict = json.loads(output_path.read_bytes())
+    assert free_games["free_games"]
+    assert free_games["free_games"][0]["id"]
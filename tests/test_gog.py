@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import Generator
 from typing import Any
 
+import pytest
 from discord_webhook import DiscordEmbed
 
 from discord_free_game_notifier.gog import (
@@ -11,12 +12,14 @@ from discord_free_game_notifier.gog import (
 )
 
 
+@pytest.mark.network
 def test_get_free_gog_game() -> None:
     """Test if we can get the free game from GOG."""
     get_free_gog_game()
 
 
 # Define the test.
+@pytest.mark.network
 def test_get_free_gog_game_from_list() -> None:
     """Test if we can get the free game from GOG.
 
@@ -29,30 +32,31 @@ def test_get_free_gog_game_from_list() -> None:
     assert free_game is not None
     assert isinstance(free_game, Generator)
 
-    # Loop through the generator.
-    for game in free_game:
-        assert isinstance(game, DiscordEmbed)
-
-        if game.author is None:
-            # If the author is None, we can't do any tests.
-            msg = "Author is None."
-            raise AssertionError(msg)
-
-        if game.image is None:
-            # If the image is None, we can't do any tests.
-            msg = "Image is None."
-            raise AssertionError(msg)
-
-        if game.description is None:
-            # If the image is None, we can't do any tests.
-            msg = "Image is None."
-            raise AssertionError(msg)
-
-        assert game.author["name"]
-        assert game.author["icon_url"]
-        assert game.author["url"]
-        assert game.image["url"]
-        assert game.description.startswith("[Click here to claim")
-
-        # Stop the generator.
-        break
+    # Only the first game is checked, so don't scrape past it.
+    game: DiscordEmbed | None = next(free_game, None)
+    if game is None:
+        # No free games in the store right now.
+        return
+
+    assert isinstance(game, DiscordEmbed)
+
+    if game.author is None:
+        # If the author is None, we can't do any tests.
+        msg = "Author is None."
+        raise AssertionError(msg)
+
+    if game.image is None:
+        # If the image is None, we can't do any tests.
+        msg = "Image is None."
+        raise AssertionError(msg)
+
+    if game.description is None:
+        # If the description is None, we can't do any tests.
+        msg = "Description is None."
+        raise AssertionError(msg)
+
+    assert game.author["name"]
+    assert game.author["icon_url"]
+    assert game.author["url"]
+    assert game.image["url"]
+    assert game.description.startswith("[Click here to claim")
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import requests
+
+from discord_free_game_notifier import settings
+from discord_free_game_notifier.steam import get_free_steam_games
+
+if TYPE_CHECKING:
+    import pytest
+    from discord_webhook import DiscordEmbed
+
+# Trimmed copy of the Steam search page, the first row has more than one class like the real site.
+STEAM_SEARCH_HTML: str = (Path(__file__).parent / "steam_search.html").read_text(encoding="utf-8")
+
+
+def test_get_free_steam_games(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that every search result row becomes an embed, whatever other classes it has."""
+    monkeypatch.setattr(settings, "app_dir", str(tmp_path))
+
+    def fake_get(url: str, headers: dict[str, str], timeout: int) -> requests.Response:  # noqa: ARG001
+        response = requests.Response()
+        response.status_code = 200
+        response._content = STEAM_SEARCH_HTML.encode("utf-8")  # noqa: SLF001
+        response.encoding = "utf-8"
+        return response
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    games: list[DiscordEmbed] = list(get_free_steam_games())
+
+    assert [game.author["name"] for game in games] == ["First Game", "Second Game"]
+    assert games[0].author["url"] == "https://store.steampowered.com/app/1234/First_Game/"
+    assert games[0].image["url"] == "https://cdn.cloudflare.steamstatic.com/steam/apps/1234/header.jpg"
+    assert (tmp_path / "steam.txt").read_text(encoding="utf-8") == "First Game\nSecond Game\n"
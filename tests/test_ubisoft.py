@@ -1,21 +1,28 @@
-from pathlib import Path
+from __future__ import annotations
 
+import json
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+import requests
+
+from discord_free_game_notifier import settings
 from discord_free_game_notifier.ubisoft import create_json_file, get_json
 
+if TYPE_CHECKING:
+    from pathlib import Path
 
-def test_create_json_file() -> None:
-    """Test that the create_json_file function creates a file."""
-    # Remove old file
-    if Path("pages/ubisoft.json").exists():
-        Path("pages/ubisoft.json").unlink()
 
-    # Create the file
-    create_json_file()
+def test_create_json_file(tmp_path: Path) -> None:
+    """Test that the create_json_file function creates a file."""
+    output_path: Path = tmp_path / "ubisoft.json"
+    create_json_file(output_path=output_path)
 
-    # Check if the file exists
-    assert Path("pages/ubisoft.json").exists()
+    assert output_path.exists()
 
 
+@pytest.mark.network
 def test_get_json() -> None:
     """Test that the get_json function returns a dict."""
     json = get_json()
@@ -29,3 +36,102 @@ def test_get_json() -> None:
     assert json["free_games"][0]["end_date"]
     assert json["free_games"][0]["description"]
     assert json["free_games"][0]["image_link"]
+
+
+def make_response(status_code: int, body: dict | None = None, headers: dict[str, str] | None = None) -> requests.Response:
+    """Build a requests.Response like the one GitHub Pages sends for ubisoft.json.
+
+    Args:
+        status_code: The HTTP status code.
+        body: The JSON body, if any.
+        headers: The response headers.
+
+    Returns:
+        The response.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = json.dumps(body).encode("utf-8") if body is not None else b""  # noqa: SLF001
+    response.encoding = "utf-8"
+    return response
+
+
+def test_get_json_not_modified(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that get_json sends the cached ETag and reuses the cached file on a 304."""
+    cached: dict = {"free_games": [{"id": "cached_game"}]}
+    (tmp_path / "ubisoft.json").write_text(json.dumps(cached), encoding="utf-8")
+    (tmp_path / "ubisoft.etag").write_text('"abc123"', encoding="utf-8")
+    monkeypatch.setattr(settings, "app_dir", str(tmp_path))
+
+    sent_headers: dict[str, str] = {}
+
+    def fake_get(url: str, headers: dict[str, str], timeout: int) -> requests.Response:  # noqa: ARG001
+        sent_headers.update(headers)
+        return make_response(HTTPStatus.NOT_MODIFIED)
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    assert get_json() == cached
+    assert sent_headers["If-None-Match"] == '"abc123"'
+
+
+def test_get_json_caches_response_with_etag(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that get_json saves the body and its ETag when the response has an ETag."""
+    body: dict = {"free_games": [{"id": "new_game"}]}
+    monkeypatch.setattr(settings, "app_dir", str(tmp_path))
+    monkeypatch.setattr(requests, "get", lambda *_, **__: make_response(HTTPStatus.OK, body, {"ETag": '"def456"'}))
+
+    assert get_json() == body
+    assert json.loads((tmp_path / "ubisoft.json").read_text(encoding="utf-8")) == body
+    assert (tmp_path / "ubisoft.etag").read_text(encoding="utf-8") == '"def456"'
+
+
+def test_get_json_without_etag_is_not_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that get_json doesn't cache anything when the response has no ETag."""
+    body: dict = {"free_games": [{"id": "new_game"}]}
+    monkeypatch.setattr(settings, "app_dir", str(tmp_path))
+    monkeypatch.setattr(requests, "get", lambda *_, **__: make_response(HTTPStatus.OK, body))
+
+    assert get_json() == body
+    assert not (tmp_path / "ubisoft.json").exists()
+    assert not (tmp_path / "ubisoft.etag").exists()
+
+
+def test_get_json_corrupt_cache_refetches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a broken cache on a 304 is thrown away and the whole file is fetched again."""
+    body: dict = {"free_games": [{"id": "new_game"}]}
+    (tmp_path / "ubisoft.json").write_text('{"free_games": [', encoding="utf-8")
+    (tmp_path / "ubisoft.etag").write_text('"abc123"', encoding="utf-8")
+    monkeypatch.setattr(settings, "app_dir", str(tmp_path))
+
+    sent_headers: list[dict[str, str]] = []
+
+    def fake_get(url: str, headers: dict[str, str], timeout: int) -> requests.Response:  # noqa: ARG001
+        sent_headers.append(dict(headers))
+        if "If-None-Match" in headers:
+            return make_response(HTTPStatus.NOT_MODIFIED)
+        return make_response(HTTPStatus.OK, body)
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    assert get_json() == body
+    assert sent_headers == [{"If-None-Match": '"abc123"'}, {}]
+    assert not (tmp_path / "ubisoft.json").exists()
+    assert not (tmp_path / "ubisoft.etag").exists()
+
+
+def test_get_json_not_modified_without_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a 304 for a request without If-None-Match gives up instead of asking again."""
+    monkeypatch.setattr(settings, "app_dir", str(tmp_path))
+
+    sent_headers: list[dict[str, str]] = []
+
+    def fake_get(url: str, headers: dict[str, str], timeout: int) -> requests.Response:  # noqa: ARG001
+        sent_headers.append(dict(headers))
+        return make_response(HTTPStatus.NOT_MODIFIED)
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    assert get_json() == {}
+    assert sent_headers == [{}]
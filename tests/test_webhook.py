@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
 from discord_webhook import DiscordEmbed
 
 from discord_free_game_notifier.webhook import send_embed_webhook, send_webhook
@@ -9,6 +10,9 @@ from discord_free_game_notifier.webhook import send_embed_webhook, send_webhook
 if TYPE_CHECKING:
     from requests import Response
 
+# Every test here posts to the real webhook.
+pytestmark = pytest.mark.network
+
 STATUS_OK = 200
 
 